@@ -304,6 +304,21 @@ class PseudoLayout(QLayout):
         return QSize()
 
 
+def _fullscreen_text(key_config):
+    """Get the text to show in a FullscreenNotification.
+
+    Args:
+        key_config: The KeyConfig to get the bindings from.
+    """
+    all_bindings = key_config.get_reverse_bindings_for('normal')
+    bindings = all_bindings.get('fullscreen --leave')
+    if bindings:
+        key = bindings[0]
+        return "Press {} to exit fullscreen.".format(key)
+    else:
+        return "Page is now fullscreen."
+
+
 class FullscreenNotification(QLabel):
 
     """A label telling the user this page is now fullscreen."""
@@ -317,13 +332,7 @@ class FullscreenNotification(QLabel):
             padding: 30px;
         """)
 
-        all_bindings = config.key_instance.get_reverse_bindings_for('normal')
-        bindings = all_bindings.get('fullscreen --leave')
-        if bindings:
-            key = bindings[0]
-            self.setText("Press {} to exit fullscreen.".format(key))
-        else:
-            self.setText("Page is now fullscreen.")
+        self.setText(_fullscreen_text(config.key_instance))
 
         self.resize(self.sizeHint())
         if config.val.content.windowed_fullscreen:
@@ -19,9 +19,8 @@
 
 """Test widgets in miscwidgets module."""
 
-from unittest import mock
 from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtWidgets import QApplication, QWidget
+from PyQt5.QtWidgets import QWidget
 import pytest
 
 from qutebrowser.misc import miscwidgets
@@ -37,25 +36,15 @@ class TestCommandLineEdit:
         cmd_edit = miscwidgets.CommandLineEdit()
         cmd_edit.set_prompt(':')
         qtbot.add_widget(cmd_edit)
-        assert cmd_edit.text() == ''
         yield cmd_edit
 
-    @pytest.fixture
-    def mock_clipboard(self, mocker):
-        """Fixture to mock QApplication.clipboard.
-
-        Return:
-            The mocked QClipboard object.
-        """
-        mocker.patch.object(QApplication, 'clipboard')
-        clipboard = mock.MagicMock()
-        clipboard.supportsSelection.return_value = True
-        QApplication.clipboard.return_value = clipboard
-        return clipboard
+    def test_initial_state(self, cmd_edit):
+        """Test the widget being empty initially."""
+        assert cmd_edit.text() == ''
 
     def test_position(self, qtbot, cmd_edit):
         """Test cursor position based on the prompt."""
-        qtbot.keyClicks(cmd_edit, ':hello')
+        cmd_edit.setText(':hello')
         assert cmd_edit.text() == ':hello'
         assert cmd_edit.cursorPosition() == len(':hello')
 
@@ -71,25 +60,24 @@ class TestCommandLineEdit:
 
     def test_invalid_prompt(self, qtbot, cmd_edit):
         """Test preventing of an invalid prompt being entered."""
-        qtbot.keyClicks(cmd_edit, '$hello')
+        qtbot.keyClick(cmd_edit, Qt.Key_Dollar)
         assert cmd_edit.text() == ''
 
-    def test_selection_home(self, qtbot, cmd_edit):
+    def test_selection_home(self, cmd_edit):
         """Test selection persisting when pressing home."""
-        qtbot.keyClicks(cmd_edit, ':hello')
+        cmd_edit.setText(':hello')
         assert cmd_edit.text() == ':hello'
         assert cmd_edit.cursorPosition() == len(':hello')
         cmd_edit.home(True)
         assert cmd_edit.cursorPosition() == len(':')
         assert cmd_edit.selectionStart() == len(':')
 
-    def test_selection_cursor_left(self, qtbot, cmd_edit):
+    def test_selection_cursor_left(self, cmd_edit):
         """Test selection persisting when moving to the first char."""
-        qtbot.keyClicks(cmd_edit, ':hello')
+        cmd_edit.setText(':hello')
         assert cmd_edit.text() == ':hello'
         assert cmd_edit.cursorPosition() == len(':hello')
-        for _ in ':hello':
-            qtbot.keyClick(cmd_edit, Qt.Key_Left, modifier=Qt.ShiftModifier)
+        cmd_edit.cursorBackward(True, len(':hello'))
         assert cmd_edit.cursorPosition() == len(':')
         assert cmd_edit.selectionStart() == len(':')
 
@@ -106,7 +94,6 @@ class TestWrapperLayout:
     def container(self, qtbot):
         wrapped = WrappedWidget()
         parent = QWidget()
-        qtbot.add_widget(wrapped)
         qtbot.add_widget(parent)
         layout = miscwidgets.WrapperLayout(parent)
         layout.wrap(parent, wrapped)
@@ -130,14 +117,21 @@ class TestFullscreenNotification:
         ({'a': 'fullscreen --leave'}, "Press a to exit fullscreen."),
         ({}, "Page is now fullscreen."),
     ])
-    def test_text(self, qtbot, config_stub, key_config_stub, bindings, text):
+    def test_text(self, config_stub, key_config_stub, bindings, text):
         config_stub.val.bindings.default = {}
         config_stub.val.bindings.commands = {'normal': bindings}
+        assert miscwidgets._fullscreen_text(key_config_stub) == text
+
+    def test_widget_text(self, qtbot, config_stub, key_config_stub):
+        config_stub.val.bindings.default = {}
+        config_stub.val.bindings.commands = {
+            'normal': {'<escape>': 'fullscreen --leave'}}
         w = miscwidgets.FullscreenNotification()
         qtbot.add_widget(w)
-        assert w.text() == text
+        assert w.text() == "Press <Escape> to exit fullscreen."
 
-    def test_timeout(self, qtbot, key_config_stub):
+    def test_timeout(self, qtbot, key_config_stub, monkeypatch, stubs):
+        monkeypatch.setattr(miscwidgets, 'QTimer', stubs.InstaTimer)
         w = miscwidgets.FullscreenNotification()
         qtbot.add_widget(w)
         with qtbot.waitSignal(w.destroyed):